@@ -1,7 +1,20 @@
 import os
+import sys
+import stat
 import argparse
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import chain
+from operator import attrgetter
+
+try:
+    import orjson  # Optional: much faster --json output
+except ImportError:
+    orjson = None
 
 
 # --------------------------------------------------
@@ -14,53 +27,138 @@ class Colors:
     RESET = "\033[0m"
 
 
+# --------------------------------------------------
+# ENTRY RECORDS
+# --------------------------------------------------
+# Each entry stores its raw file type, stat.S_IFMT(st_mode), as "kind"
+# instead of three is_file / is_dir / is_link booleans. FIFOs, sockets
+# and devices keep their own S_IFMT value and are shown as OTHER.
+KIND_FILE, KIND_DIR, KIND_LINK = stat.S_IFREG, stat.S_IFDIR, stat.S_IFLNK
+
+KIND_NAMES = {KIND_FILE: "FILE", KIND_DIR: "DIR", KIND_LINK: "LINK"}
+KIND_COLORS = {KIND_FILE: Colors.FILE, KIND_DIR: Colors.DIR, KIND_LINK: Colors.LINK}
+OTHER_NAME, OTHER_COLOR = "OTHER", Colors.FILE
+
+
+class Entry:
+    """
+    Metadata for one scanned file, directory or link.
+
+    A __slots__ class instead of a dict per entry: large scans use
+    far less memory and field access is a slot load, not a hash lookup.
+    """
+    __slots__ = ("name", "path", "kind", "size", "mtime", "level")
+
+    def __init__(self, name, path, kind, size, mtime, level=0):
+        self.name = name
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime = mtime
+        self.level = level
+
+
 # --------------------------------------------------
 # METADATA EXTRACTION
 # --------------------------------------------------
-def format_metadata(path):
+def format_metadata(entry, level=0):
+    """
+    Collect metadata for an os.DirEntry produced by os.scandir().
+
+    entry.stat() is cached and does not follow symbolic links, and
+    the file type is taken from the st_mode of that same stat result.
+    """
+    try:
+        stats = entry.stat(follow_symlinks=False)
+    except (FileNotFoundError, PermissionError):
+        return None
+
+    return Entry(entry.name, entry.path, stat.S_IFMT(stats.st_mode),
+                 stats.st_size, stats.st_mtime, level)
+
+
+def format_path_metadata(path, level=0):
     """
-    Collect metadata for a file or directory.
+    Collect metadata for a path that has no DirEntry (the scan root).
 
     Uses os.lstat() instead of os.stat() so that
     symbolic links can be detected without following them.
+    The file type is read from st_mode of that single stat call.
     """
     try:
         stats = os.lstat(path)
     except (FileNotFoundError, PermissionError):
         return None
 
+    return Entry(os.path.basename(path), path, stat.S_IFMT(stats.st_mode),
+                 stats.st_size, stats.st_mtime, level)
+
+
+@lru_cache(maxsize=4096)
+def format_mtime(mtime):
+    """
+    Format a raw st_mtime as an ISO 8601 timestamp.
+
+    Entries keep the float and are only formatted when displayed.
+    Results are cached, since files unpacked or copied together
+    often share the exact same mtime.
+    """
+    return datetime.fromtimestamp(mtime).isoformat()
+
+
+def to_record(entry):
+    """
+    Expand an entry into the public JSON layout with
+    is_file / is_dir / is_link flags.
+    """
+    kind = entry.kind
     return {
-        "name": os.path.basename(path),
-        "path": path,
-        "is_file": os.path.isfile(path),
-        "is_dir": os.path.isdir(path),
-        "is_link": os.path.islink(path),
-        "size_bytes": stats.st_size,
-        "modified": datetime.fromtimestamp(stats.st_mtime).isoformat()
+        "name": entry.name,
+        "path": entry.path,
+        "is_file": kind == KIND_FILE,
+        "is_dir": kind == KIND_DIR,
+        "is_link": kind == KIND_LINK,
+        "size_bytes": entry.size,
+        "modified": format_mtime(entry.mtime),
+        "level": entry.level
     }
 
 
 # --------------------------------------------------
 # FILE FILTERS (Milestone 3)
 # --------------------------------------------------
-def apply_filters(entry, ext=None, min_size=None, name=None):
+def build_filter(ext=None, min_size=None, name=None):
     """
-    Apply user-specified filters to files.
+    Build a predicate applying user-specified filters to files.
     Directories are never filtered out.
+
+    The filter arguments are resolved once per scan rather than per
+    entry. Returns None when no filter is set, so callers can skip
+    filtering altogether.
     """
-    if entry["is_dir"]:
-        return True
+    if not (ext or min_size or name):
+        return None
+
+    # casefold() matches case-insensitively for non-ASCII names too
+    # (e.g. "STRASSE" finds "straße"), at the same cost as lower().
+    needle = name.casefold() if name else None
+
+    def predicate(entry):
+        if entry.kind == KIND_DIR:
+            return True
+
+        if ext and not entry.name.endswith(ext):
+            return False
 
-    if ext and not entry["name"].endswith(ext):
-        return False
+        if min_size and entry.size < min_size:
+            return False
 
-    if min_size and entry["size_bytes"] < min_size:
-        return False
+        if needle and needle not in entry.name.casefold():
+            return False
 
-    if name and name.lower() not in entry["name"].lower():
-        return False
+        return True
 
-    return True
+    return predicate
 
 
 # --------------------------------------------------
@@ -73,15 +171,18 @@ def sort_entries(entries, sort_key=None):
     if not sort_key:
         return entries
 
-    dirs = [e for e in entries if e["is_dir"]]
-    files = [e for e in entries if e["is_file"]]
+    dirs, files = [], []
+    for e in entries:
+        (dirs if e.kind == KIND_DIR else files).append(e)
 
+    # list.sort() already decorates each item with its key once, so
+    # plain fields use a C-level attrgetter instead of a lambda.
     if sort_key == "name":
-        files.sort(key=lambda x: x["name"].lower())
+        files.sort(key=lambda x: x.name.lower())
     elif sort_key == "size":
-        files.sort(key=lambda x: x["size_bytes"])
+        files.sort(key=attrgetter("size"))
     elif sort_key == "modified":
-        files.sort(key=lambda x: x["modified"])
+        files.sort(key=attrgetter("mtime"))
 
     return dirs + files
 
@@ -89,122 +190,543 @@ def sort_entries(entries, sort_key=None):
 # --------------------------------------------------
 # SUMMARY STATISTICS (Milestone 5)
 # --------------------------------------------------
-def print_summary(data):
+def tally_entries(entries, totals):
     """
-    Print summary statistics for scanned entries.
+    Yield entries unchanged while adding them to the summary totals,
+    so statistics can be gathered from a stream in a single pass.
+    """
+    for e in entries:
+        kind = e.kind
+        if kind == KIND_FILE:
+            totals["files"] += 1
+            totals["size"] += e.size
+        elif kind == KIND_DIR:
+            totals["dirs"] += 1
+        elif kind == KIND_LINK:
+            totals["links"] += 1
+        yield e
+
+
+def print_summary(totals):
+    """
+    Print summary statistics gathered by tally_entries().
     """
-    total_files = sum(1 for e in data if e["is_file"])
-    total_dirs = sum(1 for e in data if e["is_dir"])
-    total_links = sum(1 for e in data if e["is_link"])
-    total_size = sum(e["size_bytes"] for e in data if e["is_file"])
-
     print("\nSummary")
     print("-" * 40)
-    print(f"Total files       : {total_files}")
-    print(f"Total directories : {total_dirs}")
-    print(f"Total symlinks    : {total_links}")
-    print(f"Total size (bytes): {total_size}")
+    print(f"Total files       : {totals['files']}")
+    print(f"Total directories : {totals['dirs']}")
+    print(f"Total symlinks    : {totals['links']}")
+    print(f"Total size (bytes): {totals['size']}")
 
 
 # --------------------------------------------------
-# NON-RECURSIVE DIRECTORY SCAN
+# ROOT DIRECTORY ACCESS
 # --------------------------------------------------
-def explore_directory(path, show_hidden=False, max_entries=5000,
-                      ext=None, min_size=None, name=None):
+def _scan_root(scan, *args):
+    """
+    Run scan(*args) on the directory given by --path and return its
+    result, or report why it cannot be read and return None.
+    """
     try:
-        items = os.listdir(path)
-    except (FileNotFoundError, PermissionError):
+        return scan(*args)
+    except PermissionError:
         print("❌ Error accessing directory.")
-        return []
+    except OSError:
+        # Missing paths, non-directories, symlink loops, names that
+        # are too long, ...
+        print("❌ Invalid directory")
+    return None
+
+
+# --------------------------------------------------
+# NON-RECURSIVE DIRECTORY SCAN
+# --------------------------------------------------
+# With --jobs, stat() calls for a large directory are spread over a
+# thread pool in chunks of this many entries; smaller directories are
+# handled inline, where thread start-up would cost more than it saves.
+METADATA_CHUNK = 64
+
+
+def explore_directory(path, show_hidden=False, max_entries=5000,
+                      predicate=None, jobs=1):
+    """
+    List a directory and return an iterator over its entries' metadata,
+    or None if the directory cannot be read.
+
+    The listing (and its warnings) happens up front; metadata is
+    collected lazily as the caller consumes the iterator.
+    """
+    listing = _scan_root(_list_directory, path, show_hidden, max_entries)
+    if listing is None:
+        return None
+
+    items, truncated = listing
+    if truncated:
+        print(f"⚠️  Directory has more than {max_entries} items. Showing first {max_entries}.")
 
-    if not show_hidden:
-        items = [i for i in items if not i.startswith(".")]
+    entries = _iter_metadata(items, jobs)
+    if predicate is not None:
+        entries = filter(predicate, entries)
+    return entries
 
-    if len(items) > max_entries:
-        print(f"⚠️  Directory has {len(items)} items. Showing first {max_entries}.")
-        items = items[:max_entries]
 
-    results = []
+def _list_directory(path, show_hidden=False, max_entries=5000):
+    """
+    Return (entries, truncated): up to max_entries visible DirEntry
+    objects, and whether more were left unread.
+    Raises OSError if the directory cannot be read.
+    """
+    # scandir never yields empty names, so name[0] is a safe (and about
+    # twice as fast) stand-in for name.startswith(".").
+    # Reading stops one entry past max_entries, so memory is bounded by
+    # the limit rather than by the size of the directory.
+    items = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if not show_hidden and entry.name[0] == ".":
+                continue
+            if len(items) >= max_entries:
+                return items, True
+            items.append(entry)
+    return items, False
+
+
+def _iter_metadata(items, jobs=1):
+    if jobs > 1 and len(items) > METADATA_CHUNK:
+        chunks = [items[i:i + METADATA_CHUNK]
+                  for i in range(0, len(items), METADATA_CHUNK)]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for metas in pool.map(_chunk_metadata, chunks):
+                yield from metas
+        return
+
     for item in items:
-        meta = format_metadata(os.path.join(path, item))
-        if meta and apply_filters(meta, ext, min_size, name):
-            meta["level"] = 0
-            results.append(meta)
+        meta = format_metadata(item)
+        if meta:
+            yield meta
 
-    return results
+
+def _chunk_metadata(items):
+    return [meta for meta in map(format_metadata, items) if meta]
 
 
 # --------------------------------------------------
 # RECURSIVE DIRECTORY SCAN
 # --------------------------------------------------
+def _scan_directory(path, level, show_hidden=False, max_entries=5000,
+                    sort_key=None):
+    """
+    Scan a single directory and collect metadata for its entries.
+
+    Returns (files, subdirs): metadata for the non-directory entries
+    (sorted by sort_key) and for the subdirectories, all tagged with
+    the given level. Raises OSError if the directory cannot be read.
+    """
+    files, subdirs = [], []
+    remaining = max_entries
+
+    # One fused pass over the scandir iterator: hidden-name check,
+    # metadata and classification per entry, with no intermediate
+    # lists, and reading stops as soon as max_entries is reached.
+    with os.scandir(path) as it:
+        for entry in it:
+            if remaining <= 0:
+                break
+            if not show_hidden and entry.name[0] == ".":
+                continue
+            remaining -= 1
+
+            meta = format_metadata(entry, level)
+            if meta:
+                (subdirs if meta.kind == KIND_DIR else files).append(meta)
+
+    return sort_entries(files, sort_key), subdirs
+
+
+def _scan_subdirectory(*args):
+    """
+    _scan_directory() for directories below the root: unreadable
+    ones are skipped silently, as os.walk() does.
+    """
+    try:
+        return _scan_directory(*args)
+    except OSError:
+        return [], []
+
+
+# With --jobs, at most this many subdirectory scans per worker are
+# queued or held ahead of the entries being yielded, so read-ahead
+# stays bounded and stopping early only waits for scans in progress.
+SCAN_PREFETCH = 4
+
+
+def _walk_entries(root_scan, depth=None, show_hidden=False, max_entries=5000,
+                  sort_key=None, jobs=1):
+    """
+    Yield metadata for everything below the root, top-down, starting
+    from the root directory's already completed scan.
+
+    Uses an explicit DFS stack of [dir_meta, level, future] instead of
+    recursion. Files of a directory come before its subdirectories,
+    and each subdirectory is followed by its own contents.
+    Subdirectories deeper than depth are never pushed, so pruned
+    subtrees are not scanned at all.
+
+    With jobs > 1, the subdirectories nearest the top of the stack are
+    handed to a thread pool, up to jobs * SCAN_PREFETCH at a time, so
+    stat() latency overlaps while entries are still yielded in the
+    same order.
+    """
+    # Resolve "no depth limit" once instead of per directory.
+    max_level = depth if depth is not None else float("inf")
+    window = jobs * SCAN_PREFETCH
+
+    stack = []
+    in_flight = 0
+
+    with ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as pool:
+        try:
+            files, subdirs = root_scan
+            level = 1
+            while True:
+                yield from files
+
+                if level <= max_level:
+                    stack.extend([meta, level + 1, None]
+                                 for meta in reversed(subdirs))
+                if not stack:
+                    break
+
+                if pool is not None:
+                    # Top up the read-ahead, next directories first.
+                    for item in reversed(stack):
+                        if in_flight >= window:
+                            break
+                        if item[2] is None:
+                            item[2] = pool.submit(
+                                _scan_subdirectory, item[0].path, item[1],
+                                show_hidden, max_entries, sort_key)
+                            in_flight += 1
+
+                dir_meta, level, future = stack.pop()
+                yield dir_meta
+
+                if future is None:
+                    files, subdirs = _scan_subdirectory(
+                        dir_meta.path, level, show_hidden, max_entries, sort_key)
+                else:
+                    files, subdirs = future.result()
+                    in_flight -= 1
+        finally:
+            # Closed early (Ctrl-C, broken pipe): drop queued scans so
+            # leaving the pool only waits for the ones already running.
+            for _, _, future in stack:
+                if future is not None:
+                    future.cancel()
+
+
 def recursive_explore(path, show_hidden=False, max_entries=5000,
-                      depth=None, ext=None, min_size=None, name=None):
-    results = []
+                      depth=None, predicate=None, sort_key=None, jobs=1):
+    """
+    Return an iterator over metadata for path and everything below it
+    as a tree, in display order, or None if path cannot be read.
+    Files are sorted within each directory, so only one directory's
+    entries are buffered, plus, with jobs > 1, the results of at most
+    jobs * SCAN_PREFETCH subdirectory scans read ahead.
+
+    The root directory is read up front, so a bad path is reported
+    before any output is produced.
+    """
+    root_scan = _scan_root(_scan_directory, path, 1, show_hidden,
+                           max_entries, sort_key)
+    if root_scan is None:
+        return None
 
-    for root, dirs, files in os.walk(path):
-        level = root.replace(path, "").count(os.sep)
+    entries = _walk_entries(root_scan, depth, show_hidden, max_entries,
+                            sort_key, jobs)
+    if predicate is not None:
+        entries = filter(predicate, entries)
+
+    root_meta = format_path_metadata(path)
+    return chain([root_meta] if root_meta else [], entries)
+
+
+# --------------------------------------------------
+# SUMMARY-ONLY SCAN
+# --------------------------------------------------
+def _count_directory(path, show_hidden=False, max_entries=5000):
+    """
+    Count one directory's entries without building Entry objects.
 
-        if depth is not None and level > depth:
-            continue
+    Returns (files, links, size, subdirs): the number of regular files
+    and symlinks, the files' total size and the subdirectories' paths.
+    Raises OSError if the directory cannot be read.
 
-        if not show_hidden:
-            dirs[:] = [d for d in dirs if not d.startswith(".")]
-            files = [f for f in files if not f.startswith(".")]
+    Types come from the directory read itself; only regular files are
+    stat()ed, for their size.
+    """
+    files = links = size = 0
+    subdirs = []
+    remaining = max_entries
+
+    with os.scandir(path) as it:
+        for entry in it:
+            if remaining <= 0:
+                break
+            if not show_hidden and entry.name[0] == ".":
+                continue
+            remaining -= 1
+
+            if entry.is_symlink():
+                links += 1
+            elif entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                try:
+                    size += entry.stat(follow_symlinks=False).st_size
+                except (FileNotFoundError, PermissionError):
+                    continue
+                files += 1
+
+    return files, links, size, subdirs
+
+
+def _count_subdirectory(path, show_hidden=False, max_entries=5000):
+    """
+    _count_directory() for directories below the root: unreadable
+    ones are skipped silently, as in the normal scan.
+    """
+    try:
+        return _count_directory(path, show_hidden, max_entries)
+    except OSError:
+        return 0, 0, 0, []
 
-        if len(dirs) + len(files) > max_entries:
-            dirs[:] = dirs[:max_entries]
-            files = files[:max_entries]
 
-        dir_meta = format_metadata(root)
-        if dir_meta:
-            dir_meta["level"] = level
-            results.append(dir_meta)
+def summarize(path, show_hidden=False, max_entries=5000, depth=None,
+              recursive=False, jobs=1):
+    """
+    Compute the --summary totals without collecting or printing entries.
 
-        for fname in files:
-            meta = format_metadata(os.path.join(root, fname))
-            if meta and apply_filters(meta, ext, min_size, name):
-                meta["level"] = level + 1
-                results.append(meta)
+    Counts the same entries as a normal scan with the same options, or
+    returns None if path cannot be read. With jobs > 1, each level of
+    subdirectories is counted on a thread pool.
+    """
+    counts = _scan_root(_count_directory, path, show_hidden, max_entries)
+    if counts is None:
+        return None
 
-    return results
+    totals = {"files": 0, "dirs": 0, "links": 0, "size": 0}
+
+    def add(counts):
+        files, links, size, subdirs = counts
+        totals["files"] += files
+        totals["links"] += links
+        totals["size"] += size
+        return subdirs
+
+    subdirs = add(counts)
+    if not recursive:
+        totals["dirs"] += len(subdirs)
+        return totals
+
+    root_meta = format_path_metadata(path)
+    if root_meta:
+        if root_meta.kind == KIND_DIR:
+            totals["dirs"] += 1
+        elif root_meta.kind == KIND_LINK:
+            totals["links"] += 1
+
+    # Same depth rule as _walk_entries(): subdirectories at a level past
+    # depth are neither counted nor scanned. Order does not matter for
+    # the totals, so the tree is counted one level at a time.
+    max_level = depth if depth is not None else float("inf")
+    count = partial(_count_subdirectory, show_hidden=show_hidden,
+                    max_entries=max_entries)
+
+    with ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as pool:
+        scan_level = map if pool is None else pool.map
+
+        level = 1
+        while subdirs and level <= max_level:
+            totals["dirs"] += len(subdirs)
+            children = []
+            for counts in scan_level(count, subdirs):
+                children.extend(add(counts))
+            subdirs = children
+            level += 1
+
+    return totals
 
 
 # --------------------------------------------------
 # OUTPUT FORMATTING
 # --------------------------------------------------
+# Output lines are collected and written in batches of this size
+# rather than with one print() per entry.
+WRITE_BATCH = 1000
+
+# stdout write buffer when output is redirected to a file or pipe.
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Table column widths; the type cells are padded once up front.
+TYPE_WIDTH, NAME_WIDTH, SIZE_WIDTH = 10, 30, 12
+TYPE_CELLS = {kind: name.ljust(TYPE_WIDTH) for kind, name in KIND_NAMES.items()}
+OTHER_CELL = OTHER_NAME.ljust(TYPE_WIDTH)
+
+
+@contextmanager
+def buffered_stdout():
+    """
+    Give sys.stdout a 1 MiB write buffer while output is not a terminal,
+    so large scans are written in few, large write() calls.
+
+    Interactive terminals keep the usual line-buffered stream.
+    """
+    original = sys.stdout
+    if original is None:
+        # No stdout at all (pythonw): discard the output, as print() does.
+        sys.stdout = open(os.devnull, "w")
+    else:
+        try:
+            fd = None if original.isatty() else original.fileno()
+        except (AttributeError, OSError, ValueError):
+            # No file descriptor behind stdout (io.StringIO, captured
+            # output): write to it as it is.
+            fd = None
+        if fd is None:
+            yield
+            return
+
+        original.flush()
+        sys.stdout = open(fd, "w", buffering=OUTPUT_BUFFER_SIZE,
+                          encoding=original.encoding, errors=original.errors,
+                          closefd=False)
+    try:
+        yield
+    except BaseException:
+        # Already failing (e.g. BrokenPipeError from `| head`): flushing
+        # the rest would only fail again, so keep the original error.
+        try:
+            sys.stdout.close()
+        except BrokenPipeError:
+            pass
+        raise
+    else:
+        sys.stdout.close()
+    finally:
+        sys.stdout = original
+
+
+def flush_lines(lines):
+    """
+    Write buffered output lines to stdout in one call and clear them.
+    """
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
 def print_table(data, use_color=False):
-    print(f"{'Type':10} | {'Name':30} | {'Size (bytes)':12} | Last Modified")
-    print("-" * 80)
+    lines = [
+        f"{'Type'.ljust(TYPE_WIDTH)} | {'Name'.ljust(NAME_WIDTH)} | "
+        f"{'Size (bytes)'.ljust(SIZE_WIDTH)} | Last Modified",
+        "-" * 80
+    ]
 
+    # str.ljust/rjust are cheaper per row than format-spec padding.
     for e in data:
-        ftype = "FILE" if e["is_file"] else "DIR" if e["is_dir"] else "LINK"
-
-        name = e["name"]
+        name = e.name[:NAME_WIDTH].ljust(NAME_WIDTH)
         if use_color:
-            if e["is_dir"]:
-                name = f"{Colors.DIR}{name}{Colors.RESET}"
-            elif e["is_file"]:
-                name = f"{Colors.FILE}{name}{Colors.RESET}"
-            else:
-                name = f"{Colors.LINK}{name}{Colors.RESET}"
+            # Colour after padding so escape codes don't count as width
+            name = f"{KIND_COLORS.get(e.kind, OTHER_COLOR)}{name}{Colors.RESET}"
+
+        lines.append(f"{TYPE_CELLS.get(e.kind, OTHER_CELL)} | {name} | "
+                     f"{str(e.size).rjust(SIZE_WIDTH)} | {format_mtime(e.mtime)}")
+        if len(lines) >= WRITE_BATCH:
+            flush_lines(lines)
+
+    flush_lines(lines)
+
+
+def encode_json(record, indent=None):
+    """
+    Serialise one record, with orjson when it is installed.
+
+    orjson refuses file names that are not valid UTF-8 and writes
+    non-ASCII names unescaped, which stdout's encoding may not cover;
+    the json module handles those records, escaping them to ASCII.
+    """
+    if orjson is not None:
+        try:
+            row = orjson.dumps(record,
+                               option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if row.isascii():
+                if indent:
+                    # orjson only indents by 2; records are flat, so
+                    # widening each line's indent gives json's layout.
+                    row = row.replace(b"\n  ", b"\n" + b" " * indent)
+                return row.decode()
+
+    if indent:
+        return json.dumps(record, indent=indent)
+    return json.dumps(record, separators=(",", ":"))
+
 
-        print(f"{ftype:10} | {name[:30]:30} | {e['size_bytes']:12} | {e['modified']}")
+def print_json(data, compact=False):
+    """
+    Print entries as a JSON array, one record at a time.
+
+    Each entry is turned into its record and serialised as the scan
+    streams in, and rows are written in batches, so neither the full
+    list of records nor the whole document is held in memory. The
+    layout matches serialising the complete list with a 4-space indent,
+    whether or not orjson is installed, and non-ASCII names are always
+    escaped; compact drops all indentation.
+    """
+    indent = None if compact else 4
+    pad = "\n" + " " * indent if indent else ""
+
+    rows = []
+    written = False
+
+    def flush_rows():
+        nonlocal written
+        if rows:
+            sys.stdout.write(("," if written else "") + ",".join(rows))
+            written = True
+            rows.clear()
+
+    sys.stdout.write("[")
+    for e in data:
+        row = encode_json(to_record(e), indent)
+        if indent:
+            # Re-indent the record for its place inside the array
+            row = pad + row.replace("\n", pad)
+        rows.append(row)
+        if len(rows) >= WRITE_BATCH:
+            flush_rows()
+
+    flush_rows()
+    sys.stdout.write("\n]\n" if indent and written else "]\n")
 
 
 def print_tree(data, use_color=False):
+    lines = []
     for e in data:
-        indent = "    " * e.get("level", 0)
+        indent = "    " * e.level
 
-        label = "[DIR]" if e["is_dir"] else "[FILE]" if e["is_file"] else "[LINK]"
+        label = f"[{KIND_NAMES.get(e.kind, OTHER_NAME)}]"
         if use_color:
-            if e["is_dir"]:
-                label = f"{Colors.DIR}{label}{Colors.RESET}"
-            elif e["is_file"]:
-                label = f"{Colors.FILE}{label}{Colors.RESET}"
-            else:
-                label = f"{Colors.LINK}{label}{Colors.RESET}"
+            label = f"{KIND_COLORS.get(e.kind, OTHER_COLOR)}{label}{Colors.RESET}"
 
-        print(f"{indent}{label} {e['name']}")
+        lines.append(f"{indent}{label} {e.name}")
+        if len(lines) >= WRITE_BATCH:
+            flush_lines(lines)
+
+    flush_lines(lines)
 
 
 # --------------------------------------------------
@@ -216,10 +738,12 @@ def main():
     parser.add_argument("--path", required=True)
     parser.add_argument("--hidden", action="store_true")
     parser.add_argument("--json", action="store_true")
+    parser.add_argument("--compact", action="store_true")
     parser.add_argument("--max", type=int, default=5000)
 
     parser.add_argument("--recursive", action="store_true")
     parser.add_argument("--depth", type=int)
+    parser.add_argument("--jobs", type=int, default=1)
 
     parser.add_argument("--ext")
     parser.add_argument("--min-size", type=int)
@@ -227,46 +751,56 @@ def main():
 
     parser.add_argument("--sort", choices=["name", "size", "modified"])
     parser.add_argument("--summary", action="store_true")
+    parser.add_argument("--summary-only", action="store_true")
     parser.add_argument("--color", action="store_true")
 
     args = parser.parse_args()
 
-    if not os.path.isdir(args.path):
-        print("❌ Invalid directory")
+    predicate = build_filter(args.ext, args.min_size, args.name)
+
+    # Without filters, --summary-only only needs counts: skip the
+    # metadata and output pipeline entirely.
+    if args.summary_only and predicate is None:
+        totals = summarize(args.path, args.hidden, args.max,
+                           args.depth, args.recursive, args.jobs)
+        if totals is not None:
+            print_summary(totals)
         return
 
     if args.recursive:
         data = recursive_explore(
             args.path, args.hidden, args.max,
-            args.depth, args.ext, args.min_size, args.name
+            args.depth, predicate, args.sort, args.jobs
         )
-
-        # level-wise sorting
-        sorted_data = []
-        for lvl in sorted(set(e["level"] for e in data)):
-            lvl_entries = [e for e in data if e["level"] == lvl]
-            sorted_data.extend(sort_entries(lvl_entries, args.sort))
-        data = sorted_data
-
-        if args.json:
-            print(json.dumps(data, indent=4))
-        else:
-            print_tree(data, args.color)
     else:
         data = explore_directory(
-            args.path, args.hidden, args.max,
-            args.ext, args.min_size, args.name
+            args.path, args.hidden, args.max, predicate, args.jobs
         )
-        data = sort_entries(data, args.sort)
+        if data is not None and args.sort:
+            data = sort_entries(list(data), args.sort)
 
-        if args.json:
-            print(json.dumps(data, indent=4))
-        else:
-            print_table(data, args.color)
+    # The scanners validate the path themselves and report errors
+    if data is None:
+        return
+
+    # Entries are streamed to the output as they are scanned.
+    totals = {"files": 0, "dirs": 0, "links": 0, "size": 0}
+    if args.summary or args.summary_only:
+        data = tally_entries(data, totals)
+
+    if args.summary_only:
+        deque(data, maxlen=0)
+    elif args.json:
+        print_json(data, args.compact)
+    elif args.recursive:
+        print_tree(data, args.color)
+    else:
+        print_table(data, args.color)
 
-    if args.summary:
-        print_summary(data)
+    if args.summary or args.summary_only:
+        print_summary(totals)
 
 
 if __name__ == "__main__":
-    main()
+    with buffered_stdout():
+        main()